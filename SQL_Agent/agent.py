@@ -1,6 +1,9 @@
+import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Tuple
 sys.path.append(str(Path(__file__).parent))
 
 from google.adk.agents import Agent
@@ -14,6 +17,7 @@ from toolList import (
     describe_table,
     export_query,
     append_insight,
+    append_insights,
     list_insights
 )
 from re import S
@@ -25,6 +29,37 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def install_event_loop_policy() -> bool:
+    """Use uvloop (winloop on Windows) for asyncio loops created afterwards.
+    
+    Call this from a custom entry point before starting asyncio. All tools
+    are I/O-bound coroutines, so a libuv-based loop speeds them up without
+    code changes. Nothing happens if a loop is already running (as under
+    ``adk run``), if the package is not installed, or on Python 3.14+,
+    where event loop policies are deprecated.
+    
+    Returns:
+        bool: True if the policy was installed
+    """
+    if sys.version_info >= (3, 14):
+        return False
+    try:
+        asyncio.get_running_loop()
+        return False
+    except RuntimeError:
+        pass
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    logger.info("Using %s event loop", loop_impl.__name__)
+    return True
+
+
 SYSTEM_INSTRUCTIONS = """
 I am an advanced SQL database assistant with these capabilities:
 1. Understand natural language queries and convert them to proper SQL.
@@ -43,7 +78,7 @@ Rules:
 - When generating SQL, ensure it is syntactically correct and semantically valid for a MySQL database.
 - Prioritize using the provided tools for all database interactions.
 - If a query involves sensitive data, ask for confirmation before execution.
-"""
+""".strip()
 
 SYSTEM_DESCRIPTION = """
 This SQL Agent is designed to act as an intelligent intermediary between users and a MySQL database, 
@@ -53,39 +88,49 @@ parameterized queries to prevent SQL injection. Beyond simple data retrieval, th
 complex joins, aggregations, and subqueries, and further enhances the user experience by providing 
 clear explanations of query results and suggesting optimizations for slow queries, all while maintaining 
 a detailed log of all actions for audit purposes.
-"""
+""".strip()
+
+# Database operation functions exposed to the agent, fixed at import time
+_TOOLS: Tuple[Callable, ...] = (
+    list_tables,
+    read_query,
+    write_query,
+    create_table,
+    alter_table,
+    drop_table,
+    describe_table,
+    export_query,
+    append_insight,
+    append_insights,
+    list_insights
+)
 
-def get_tools() -> List:
-    """Returns the list of available tools/functions for the agent.
+def get_tools() -> Tuple[Callable, ...]:
+    """Returns the available tools/functions for the agent.
     
     Returns:
-        List[Callable]: List of all database operation functions
+        Tuple[Callable, ...]: All database operation functions
         
     Raises:
         ValueError: If any tool is not callable
     """
-    tools = [
-        list_tables,
-        read_query,
-        write_query,
-        create_table,
-        alter_table,
-        drop_table,
-        describe_table,
-        export_query,
-        append_insight,
-        list_insights
-    ]
-    
-    
-    
-    return tools
+    return _TOOLS
+
+# Settings shared by every agent built by create_sql_agent (read-only)
+_BASE_CONFIG = MappingProxyType({
+    "description": SYSTEM_DESCRIPTION,
+    "instruction": SYSTEM_INSTRUCTIONS,
+    "tools": get_tools()
+})
 
 def create_sql_agent(name: str = "sql_database_agent", 
                    model: str = "gemini-2.5-flash",
                    additional_config: Optional[Dict[str, Any]] = None) -> Agent:
     """Creates and configures a SQL database assistant Agent.
     
+    Agents are cached, so repeated calls with the same arguments return
+    the same instance.
+    
     Args:
         name (str): Name identifier for the agent
         model (str): Model version/type to use
@@ -102,28 +147,72 @@ def create_sql_agent(name: str = "sql_database_agent",
         >>> agent = create_sql_agent()
         >>> response = agent.execute("List all customers")
     """
+    config_key = tuple(sorted(additional_config.items())) if additional_config else None
+    try:
+        hash(config_key)
+    except TypeError:
+        # Unhashable config values (e.g. callback lists) bypass the cache
+        return _build_sql_agent.__wrapped__(name, model, config_key)
+    return _build_sql_agent(name, model, config_key)
+
+@lru_cache(maxsize=None)
+def _build_sql_agent(name: str, model: str,
+                     config_key: Optional[Tuple[Tuple[str, Any], ...]]) -> Agent:
+    """Builds the Agent for create_sql_agent; memoized on its arguments."""
     try:
-        logger.info(f"Creating SQL agent {name} with model {model}")
+        logger.info("Creating SQL agent %s with model %s", name, model)
         
-        config = {
-            "name": name,
-            "model": model,
-            "description": SYSTEM_DESCRIPTION,
-            "instruction": SYSTEM_INSTRUCTIONS,
-            "tools": get_tools()
-        }
+        config = {**_BASE_CONFIG, "name": name, "model": model}
+        config["tools"] = list(config["tools"])
         
-        if additional_config:
-            config.update(additional_config)
+        if config_key:
+            config.update(config_key)
             
         agent = Agent(**config)
-        logger.info(f"Successfully created SQL agent {name}")
+        logger.info("Successfully created SQL agent %s", name)
         return agent
         
     except Exception as e:
-        logger.error(f"Failed to create SQL agent: {str(e)}")
+        logger.error("Failed to create SQL agent: %s", e)
         raise ValueError(f"Agent creation failed: {str(e)}") from e
 
-# Create the root agent instance
+def get_root_agent() -> Agent:
+    """Returns the default SQL agent, building it on first use."""
+    return create_sql_agent()
+
+def __getattr__(name: str) -> Any:
+    # Resolve ``root_agent`` lazily so importing this module stays cheap
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+async def _chat() -> None:
+    """Minimal terminal chat loop around the root agent."""
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+    
+    runner = InMemoryRunner(agent=get_root_agent(), app_name="sql_agent")
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id="user"
+    )
+    while True:
+        try:
+            text = await asyncio.to_thread(input, "[user]: ")
+        except EOFError:
+            return
+        if text.strip().lower() in ("exit", "quit"):
+            return
+        message = types.Content(role="user", parts=[types.Part(text=text)])
+        async for event in runner.run_async(
+            user_id="user", session_id=session.id, new_message=message
+        ):
+            if event.content and event.content.parts:
+                reply = "".join(part.text or "" for part in event.content.parts)
+                if reply:
+                    print(f"[{event.author}]: {reply}")
 
-root_agent = create_sql_agent()
+if __name__ == "__main__":
+    # Entry point that can use uvloop: `adk run` creates its loop before
+    # importing this module, so the policy must be set before asyncio starts.
+    install_event_loop_policy()
+    asyncio.run(_chat())
@@ -1,13 +1,24 @@
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Callable, List, Optional
 import asyncio
-from datetime import datetime
+from contextlib import asynccontextmanager
+import csv
+from datetime import date, datetime, time as dt_time, timezone
+import io
 import json
 import logging
-import mysql.connector
-from mysql.connector import Error
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+import operator
+import re
+from time import time
+import aiomysql
+from aiomysql import Error
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging is configured by the application (see agent.py)
 logger = logging.getLogger(__name__)
 
 # Database connection pool (example configuration)
@@ -16,26 +27,216 @@ DB_CONFIG = {
     'user': 'root',
     'password': 'password',
     'database': 'finly_dashboard',
-    'pool_name': 'sql_agent_pool',
     'port': 3307,
-    'pool_size': 5
+    'minsize': 5,
+    'maxsize': 20
 }
 
-async def get_db_connection():
-    """Get a database connection from the connection pool.
+# Schema required by the insight tools, created once when the pool is set up
+_INSIGHTS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS `data_insights` (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        table_name VARCHAR(255) NOT NULL,
+        insight TEXT NOT NULL,
+        metadata JSON,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX (table_name)
+    )
+"""
+
+# Identifiers (tables, columns, schemas) that are safe to interpolate into SQL
+_IDENT = re.compile(r'[A-Za-z0-9_$]{1,64}')
+
+# Rows pulled per round trip when streaming exports
+_EXPORT_BATCH_SIZE = 1000
+
+_INSERT_INSIGHT_SQL = """
+    INSERT INTO `data_insights` (table_name, insight, metadata)
+    VALUES (%s, %s, %s)
+"""
+
+# Seconds between pings that keep idle pooled connections alive
+_KEEPALIVE_INTERVAL = 30
+
+_POOL: Optional[aiomysql.Pool] = None
+_POOL_LOCK = asyncio.Lock()
+_KEEPALIVE_TASK: Optional[asyncio.Task] = None
+
+# Rows of recent SELECTs, keyed by normalized SQL and parameters.
+# Cleared wholesale by every tool that writes data or changes schema.
+_QCACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Bumped on every invalidation; a read only caches its rows if no
+# invalidation happened while it was running.
+_QCACHE_GEN = 0
+
+# Locking reads must always reach the server to take their locks
+_LOCKING_READ = re.compile(r'\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b', re.IGNORECASE)
+
+def _invalidate_cache() -> None:
+    """Drop all cached results and start a new cache generation."""
+    global _QCACHE_GEN
+    _QCACHE_GEN += 1
+    _QCACHE.clear()
+
+def _normalize(sql: str) -> str:
+    """Normalize SQL text for use in a cache key.
+
+    Only outer whitespace and a trailing semicolon are stripped; case and
+    inner whitespace are kept since they may be part of string literals.
+    """
+    return sql.strip().rstrip(';').rstrip()
+
+def _cache_key(query: str, params: Optional[Any]) -> Optional[tuple]:
+    """Build a result cache key, or return None if the query is not cacheable.
+
+    Args:
+        query: SQL query string.
+        params: Parameters passed alongside the query (dict or sequence).
 
     Returns:
-        A MySQL database connection object.
+        A hashable key for non-locking SELECT queries with hashable
+        parameters, else None.
+    """
+    if not query.lstrip().upper().startswith('SELECT') or _LOCKING_READ.search(query):
+        return None
+    if isinstance(params, dict):
+        param_key = tuple(sorted(params.items()))
+    else:
+        param_key = tuple(params) if params else ()
+    key = (_normalize(query), param_key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+async def _keepalive(pool: aiomysql.Pool) -> None:
+    """Periodically ping an idle pooled connection until the pool closes.
+
+    Keeps connections from being dropped by MySQL's ``wait_timeout`` so the
+    first query after a quiet period does not pay for a reconnect.
+    """
+    while True:
+        await asyncio.sleep(_KEEPALIVE_INTERVAL)
+        if pool.closed:
+            return
+        if not pool.freesize:
+            continue
+        try:
+            async with pool.acquire() as conn:
+                await conn.ping(reconnect=True)
+        except Error as e:
+            logger.warning("Keepalive ping failed: %s", e)
+
+async def init_pool() -> aiomysql.Pool:
+    """Create the shared connection pool if it does not exist yet.
+
+    Also runs the one-time schema setup (``_INSIGHTS_TABLE_DDL``) so the
+    tools never have to issue DDL on their hot path (a failure there is
+    logged, not raised), and starts a background keepalive task. The pool
+    itself opens ``minsize`` connections up front.
+
+    Returns:
+        The module-level aiomysql connection pool.
+
+    Raises:
+        Error: If the pool cannot be established.
+    """
+    global _POOL, _KEEPALIVE_TASK
+    async with _POOL_LOCK:
+        if _POOL is None:
+            try:
+                pool = await aiomysql.create_pool(
+                    host=DB_CONFIG['host'],
+                    port=DB_CONFIG['port'],
+                    user=DB_CONFIG['user'],
+                    password=DB_CONFIG['password'],
+                    db=DB_CONFIG['database'],
+                    minsize=DB_CONFIG['minsize'],
+                    maxsize=DB_CONFIG['maxsize'],
+                    autocommit=True
+                )
+            except Error as e:
+                logger.error("Database connection failed: %s", e)
+                raise
+            try:
+                async with pool.acquire() as conn:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute(_INSIGHTS_TABLE_DDL)
+            except Error as e:
+                # Not fatal (e.g. a user without CREATE privilege): the other
+                # tools still work and the insight tools report the missing table.
+                logger.warning("Could not create data_insights table: %s", e)
+            _POOL = pool
+            _KEEPALIVE_TASK = asyncio.create_task(_keepalive(pool))
+    return _POOL
+
+async def get_db_connection() -> aiomysql.Pool:
+    """Get the database connection pool, creating it on first use.
+
+    Returns:
+        The shared aiomysql connection pool. Use ``pool.acquire()`` to
+        borrow a connection.
 
     Raises:
         Error: If the connection cannot be established.
     """
-    try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        return connection
-    except Error as e:
-        logger.error(f"Database connection failed: {e}")
-        raise
+    if _POOL is None:
+        return await init_pool()
+    return _POOL
+
+def _ident(name: str) -> str:
+    """Validate an identifier before it is interpolated into SQL.
+
+    Args:
+        name: Table, column, or schema name.
+
+    Returns:
+        The name unchanged if it is valid.
+
+    Raises:
+        ValueError: If the name is not a plain MySQL identifier.
+    """
+    if not isinstance(name, str) or not _IDENT.fullmatch(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return name
+
+def _row_getter(headers: List[str]) -> Callable[[dict], tuple]:
+    """Build a getter that returns a row dict's values as a tuple in header order."""
+    if len(headers) == 1:
+        # itemgetter with a single key returns the bare value, not a tuple
+        key = headers[0]
+        return lambda row: (row[key],)
+    return operator.itemgetter(*headers)
+
+def _json_default(value: Any) -> str:
+    """Convert values stdlib json cannot encode the way orjson does."""
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return str(value)
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed.
+
+    Both backends produce the same text: ISO 8601 dates and times, and
+    ``str`` for other values JSON has no type for (e.g. Decimal).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False)
+
+# Last [epoch milliseconds, formatted timestamp] pair handed out by _now()
+_TS_CACHE: list = [0, ""]
+
+def _now() -> str:
+    """Return the current UTC time in ISO format, reformatting at most once per millisecond."""
+    t = time()
+    ms = int(t * 1000)
+    if ms != _TS_CACHE[0]:
+        _TS_CACHE[0] = ms
+        _TS_CACHE[1] = datetime.fromtimestamp(t, timezone.utc).isoformat(timespec='milliseconds')
+    return _TS_CACHE[1]
 
 def format_response(success: bool, data: Any = None, error: Optional[str] = None) -> dict:
     """Standardize the response format for all tool functions.
@@ -50,15 +251,465 @@ def format_response(success: bool, data: Any = None, error: Optional[str] = None
             - success (bool): Operation status
             - data (Any): Result payload
             - error (str): Error message if failed
-            - timestamp (str): ISO format timestamp
+            - timestamp (str): ISO format UTC timestamp (millisecond precision)
     """
     return {
         'success': success,
         'data': data,
         'error': error,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now()
     }
 
+class Session:
+    """Database tools bound to a single pooled connection.
+
+    Each method mirrors the module-level tool of the same name and returns
+    the same standardized response, but runs on ``conn`` instead of
+    checking out a connection of its own. Create one with ``session()``.
+
+    Connections run in autocommit mode. To group writes into a transaction,
+    start one with ``await s.conn.begin()`` and end it with
+    ``await s.commit()`` (not ``s.conn.commit()``), which also invalidates
+    the shared result cache once the writes become visible.
+
+    Example:
+        >>> async with session() as s:
+        ...     await s.describe_table('customers')
+        ...     await s.read_query("SELECT COUNT(*) AS n FROM customers")
+    """
+
+    def __init__(self, conn: aiomysql.Connection):
+        self.conn = conn
+
+    async def commit(self) -> None:
+        """Commit the session's transaction and invalidate the result cache.
+
+        Reads by other callers between a write and the commit may have
+        cached pre-commit rows, so the cache is cleared after committing
+        (and also if the commit fails, since the outcome is then unknown).
+
+        Raises:
+            Error: If the commit fails.
+        """
+        try:
+            await self.conn.commit()
+        finally:
+            _invalidate_cache()
+
+    async def _rollback(self) -> None:
+        """Undo the open transaction, if any, after a failed write.
+
+        The pool runs in autocommit mode, so this only matters when the
+        caller started a transaction on ``conn``. A connection that cannot
+        roll back is closed so the pool drops it instead of reusing it.
+        """
+        if self.conn.closed or not self.conn.get_transaction_status():
+            return
+        # Cached results may have been computed from the discarded writes
+        _invalidate_cache()
+        try:
+            await self.conn.rollback()
+        except Error:
+            self.conn.close()
+
+    async def list_tables(self, schema: Optional[str] = None) -> dict:
+        """List all tables in the database or a specific schema (see ``list_tables``)."""
+        try:
+            schema_name = schema or DB_CONFIG['database']
+            # Plain tuple cursor and a fixed column name, whatever the schema
+            async with self.conn.cursor() as cursor:
+                await cursor.execute(
+                    "SELECT TABLE_NAME FROM information_schema.tables "
+                    "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME",
+                    (schema_name,)
+                )
+                tables = [row[0] for row in await cursor.fetchall()]
+                
+                # No rows may also mean the schema does not exist at all
+                if not tables:
+                    await cursor.execute(
+                        "SELECT 1 FROM information_schema.schemata WHERE SCHEMA_NAME = %s",
+                        (schema_name,)
+                    )
+                    if not await cursor.fetchone():
+                        logger.error("Error listing tables: unknown database %r", schema_name)
+                        return format_response(False, error=f"Unknown database '{schema_name}'")
+            
+            return format_response(True, {'tables': tables})
+            
+        except Error as e:
+            logger.error("Error listing tables: %s", e)
+            return format_response(False, error=str(e))
+
+    async def read_query(self, query: str, params: Optional[dict] = None) -> dict:
+        """Execute a SELECT query and return the results (see ``read_query``).
+
+        The result cache is bypassed while a transaction is open on the
+        session, since those reads may see uncommitted writes.
+        """
+        key = None if self.conn.get_transaction_status() else _cache_key(query, params)
+        cached = _QCACHE.get(key) if key is not None else None
+        if cached is not None:
+            # Hand out copies so callers cannot mutate the cached rows
+            return format_response(True, {
+                'results': [dict(row) for row in cached],
+                'row_count': len(cached)
+            })
+        
+        generation = _QCACHE_GEN
+        try:
+            async with self.conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params)
+                results = await cursor.fetchall()
+            
+            # Skip caching if a write invalidated the cache mid-query
+            if key is not None and generation == _QCACHE_GEN:
+                _QCACHE[key] = tuple(dict(row) for row in results)
+            
+            return format_response(True, {
+                'results': results,
+                'row_count': len(results)
+            })
+            
+        except Error as e:
+            logger.error("Query execution failed: %s\nQuery: %s", e, query)
+            return format_response(False, error=str(e))
+
+    async def write_query(self, query: str, params: Optional[dict] = None) -> dict:
+        """Execute an INSERT, UPDATE, or DELETE query (see ``write_query``)."""
+        try:
+            async with self.conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                affected_rows = cursor.rowcount
+                lastrowid = cursor.lastrowid
+            _invalidate_cache()
+            
+            return format_response(True, {
+                'affected_rows': affected_rows,
+                'lastrowid': lastrowid
+            })
+            
+        except Error as e:
+            await self._rollback()
+            logger.error("Write operation failed: %s\nQuery: %s", e, query)
+            return format_response(False, error=str(e))
+
+    async def create_table(self, table_name: str, columns: List[dict],
+                           constraints: Optional[List[str]] = None) -> dict:
+        """Create a new table with specified columns and constraints (see ``create_table``)."""
+        try:
+            _ident(table_name)
+            
+            column_defs = []
+            for col in columns:
+                col_def = f"`{_ident(col['name'])}` {col['type']}"
+                if col.get('constraints'):
+                    col_def += f" {col['constraints']}"
+                column_defs.append(col_def)
+            
+            # Fixed: Removed newlines from f-string
+            column_defs_str = ", ".join(column_defs)
+            constraints_str = ", " + ", ".join(constraints) if constraints else ""
+            create_stmt = f"CREATE TABLE `{table_name}` ({column_defs_str}{constraints_str})"
+            
+            async with self.conn.cursor() as cursor:
+                await cursor.execute(create_stmt)
+            _invalidate_cache()
+            
+            return format_response(True, {
+                'table_name': table_name,
+                'sql': create_stmt
+            })
+            
+        except (Error, ValueError) as e:
+            await self._rollback()
+            logger.error("Table creation failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def alter_table(self, table_name: str, alterations: List[dict]) -> dict:
+        """Modify an existing table's structure (see ``alter_table``)."""
+        try:
+            _ident(table_name)
+            
+            # Combine all column changes into one ALTER TABLE so InnoDB rebuilds
+            # the table once; renames are issued separately afterwards.
+            clauses = []
+            renames = []
+            for alter in alterations:
+                clause = alter['action']
+                if alter['action'] in ('ADD COLUMN', 'MODIFY COLUMN'):
+                    clause += f" `{_ident(alter['name'])}` {alter['type']}"
+                    if alter.get('constraints'):
+                        clause += f" {alter['constraints']}"
+                elif alter['action'] == 'DROP COLUMN':
+                    clause += f" `{_ident(alter['name'])}`"
+                elif alter['action'] == 'RENAME TO':
+                    renames.append(_ident(alter['new_name']))
+                    continue
+                clauses.append(clause)
+            
+            alter_statements = []
+            if clauses:
+                alter_statements.append(f"ALTER TABLE `{table_name}` {', '.join(clauses)}")
+            current_name = table_name
+            for new_name in renames:
+                alter_statements.append(f"ALTER TABLE `{current_name}` RENAME TO `{new_name}`")
+                current_name = new_name
+            
+            async with self.conn.cursor() as cursor:
+                for stmt in alter_statements:
+                    await cursor.execute(stmt)
+            _invalidate_cache()
+            
+            return format_response(True, {
+                'table_name': table_name,
+                'alterations': alter_statements
+            })
+            
+        except Error as e:
+            # Earlier statements may already have been applied
+            _invalidate_cache()
+            await self._rollback()
+            logger.error("Table alteration failed: %s", e)
+            return format_response(False, error=str(e))
+        except ValueError as e:
+            logger.error("Table alteration failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def drop_table(self, table_name: str, if_exists: bool = True) -> dict:
+        """Permanently remove a table from the database (see ``drop_table``)."""
+        try:
+            _ident(table_name)
+            
+            if_exists_clause = "IF EXISTS " if if_exists else ""
+            drop_stmt = f"DROP TABLE {if_exists_clause}`{table_name}`"
+            
+            async with self.conn.cursor() as cursor:
+                await cursor.execute(drop_stmt)
+            _invalidate_cache()
+            
+            return format_response(True, {
+                'table_name': table_name,
+                'sql': drop_stmt
+            })
+            
+        except (Error, ValueError) as e:
+            await self._rollback()
+            logger.error("Table drop failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def describe_table(self, table_name: str) -> dict:
+        """Retrieve the structure and indexes of a table (see ``describe_table``).
+
+        Both lookups run one after the other on the session's connection;
+        the module-level tool runs them concurrently on two connections.
+        """
+        try:
+            _ident(table_name)
+            
+            async with self.conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(f"DESCRIBE `{table_name}`")
+                structure = await cursor.fetchall()
+                
+                await cursor.execute(f"SHOW INDEX FROM `{table_name}`")
+                indexes = await cursor.fetchall()
+            
+            return format_response(True, {
+                'table_name': table_name,
+                'structure': structure,
+                'indexes': indexes
+            })
+            
+        except (Error, ValueError) as e:
+            logger.error("Table description failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def export_query(self, query: str, format: str = 'json',
+                           params: Optional[dict] = None) -> dict:
+        """Execute a query and return results in specified format (see ``export_query``)."""
+        if format not in ('json', 'csv'):
+            logger.error("Export failed: unsupported format %r", format)
+            return format_response(False, error=f"Unsupported format: {format}")
+        
+        try:
+            # Server-side cursor: rows are streamed instead of buffered up front
+            async with self.conn.cursor(aiomysql.SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                
+                buffer = io.StringIO()
+                row_count = 0
+                if format == 'json':
+                    # Serialize chunk by chunk, splicing each array's items
+                    # into one top-level array
+                    buffer.write("[")
+                    while True:
+                        chunk = await cursor.fetchmany(_EXPORT_BATCH_SIZE)
+                        if not chunk:
+                            break
+                        if row_count:
+                            buffer.write(",")
+                        buffer.write(_json_dumps(chunk)[1:-1])
+                        row_count += len(chunk)
+                    buffer.write("]")
+                else:
+                    writer = csv.writer(buffer, lineterminator="\n")
+                    get_values = None
+                    while True:
+                        chunk = await cursor.fetchmany(_EXPORT_BATCH_SIZE)
+                        if not chunk:
+                            break
+                        if get_values is None:
+                            headers = list(chunk[0].keys())
+                            writer.writerow(headers)
+                            get_values = _row_getter(headers)
+                        writer.writerows(map(get_values, chunk))
+                        row_count += len(chunk)
+                output = buffer.getvalue()
+            
+            return format_response(True, {
+                'format': format,
+                'data': output,
+                'row_count': row_count
+            })
+            
+        except Error as e:
+            logger.error("Export failed: %s\nQuery: %s", e, query)
+            return format_response(False, error=str(e))
+
+    async def append_insight(self, table_name: str, insight: str,
+                             metadata: Optional[dict] = None) -> dict:
+        """Store an analytical insight about a table or dataset (see ``append_insight``)."""
+        try:
+            async with self.conn.cursor() as cursor:
+                await cursor.execute(
+                    _INSERT_INSIGHT_SQL,
+                    (table_name, insight, _json_dumps(metadata) if metadata else None)
+                )
+                insight_id = cursor.lastrowid
+            _invalidate_cache()
+            
+            return format_response(True, {
+                'table_name': table_name,
+                'insight_id': insight_id
+            })
+            
+        except Error as e:
+            await self._rollback()
+            logger.error("Insight append failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def append_insights(self, insights: List[dict]) -> dict:
+        """Store several analytical insights in a single round trip (see ``append_insights``)."""
+        if not insights:
+            return format_response(True, {'inserted': 0})
+        
+        try:
+            rows = [
+                (item['table_name'], item['insight'],
+                 _json_dumps(item['metadata']) if item.get('metadata') else None)
+                for item in insights
+            ]
+        except (KeyError, TypeError) as e:
+            logger.error("Invalid insight batch: %s", e)
+            return format_response(
+                False,
+                error=f"Each insight must be a dict with 'table_name' and 'insight' keys ({e!r})"
+            )
+        
+        try:
+            # executemany folds the rows into one multi-row INSERT
+            async with self.conn.cursor() as cursor:
+                await cursor.executemany(_INSERT_INSIGHT_SQL, rows)
+                inserted = cursor.rowcount
+            _invalidate_cache()
+            
+            return format_response(True, {'inserted': inserted})
+            
+        except Error as e:
+            await self._rollback()
+            logger.error("Insight batch append failed: %s", e)
+            return format_response(False, error=str(e))
+
+    async def list_insights(self, table_name: Optional[str] = None) -> dict:
+        """Retrieve stored insights for a specific table or all tables (see ``list_insights``)."""
+        try:
+            query = "SELECT * FROM `data_insights`"
+            params = None
+            
+            if table_name:
+                query += " WHERE table_name = %s"
+                params = (table_name,)
+            
+            query += " ORDER BY created_at DESC"
+            
+            async with self.conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params)
+                insights = await cursor.fetchall()
+            
+            return format_response(True, {
+                'insights': insights,
+                'count': len(insights)
+            })
+            
+        except Error as e:
+            logger.error("Insight listing failed: %s", e)
+            return format_response(False, error=str(e))
+
+@asynccontextmanager
+async def session() -> AsyncIterator[Session]:
+    """Borrow one pooled connection for a sequence of tool calls.
+
+    The connection is returned to the pool when the block exits. It is
+    closed instead if the block is cancelled or fails with anything other
+    than a database or validation error, since it may be left mid-query, or
+    if a transaction is still open.
+
+    Yields:
+        Session: Tool methods bound to the borrowed connection.
+
+    Raises:
+        Error: If the connection cannot be established.
+
+    Example:
+        >>> async with session() as s:
+        ...     await s.list_tables()
+    """
+    pool = await get_db_connection()
+    async with pool.acquire() as conn:
+        try:
+            yield Session(conn)
+        except (Error, ValueError):
+            # Server and validation errors leave the connection usable, so it
+            # goes back to the pool unless a transaction is still open.
+            if conn.get_transaction_status():
+                _invalidate_cache()
+                conn.close()
+            raise
+        except BaseException:
+            # The connection may be mid-query (e.g. on cancellation); close
+            # it so the pool discards it rather than handing it out again.
+            conn.close()
+            raise
+        if conn.get_transaction_status():
+            # The pool closes (and so rolls back) connections released mid-transaction
+            _invalidate_cache()
+
+async def _fetch_all(sql: str) -> list:
+    """Run a statement on its own pooled connection and return all rows as dicts."""
+    async with session() as s:
+        async with s.conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(sql)
+            return await cursor.fetchall()
+
+async def _run(method: str, *args: Any) -> dict:
+    """Run a Session method on a short-lived session of its own."""
+    try:
+        async with session() as s:
+            return await getattr(s, method)(*args)
+    except Error as e:
+        logger.error("Database connection failed: %s", e)
+        return format_response(False, error=str(e))
+
 async def list_tables(schema: Optional[str] = None) -> dict:
     """List all tables in the database or a specific schema.
 
@@ -78,29 +729,14 @@ async def list_tables(schema: Optional[str] = None) -> dict:
         >>> await list_tables()
         {'success': True, 'data': {'tables': ['customers', 'orders']}, ...}
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        query = "SHOW TABLES"
-        if schema:
-            query = f"SHOW TABLES FROM `{schema}`"
-            
-        cursor.execute(query)
-        tables = [table[f"Tables_in_{schema or DB_CONFIG['database']}"] for table in cursor]
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {'tables': tables})
-        
-    except Error as e:
-        logger.error(f"Error listing tables: {e}")
-        return format_response(False, error=str(e))
+    return await _run('list_tables', schema)
 
 async def read_query(query: str, params: Optional[dict] = None) -> dict:
     """Execute a SELECT query and return the results.
 
+    Results are cached for up to 60 seconds; any write or schema change
+    made through these tools clears the cache.
+
     Args:
         query: SQL SELECT query string.
         params: Optional dictionary of parameters for parameterized queries.
@@ -118,24 +754,7 @@ async def read_query(query: str, params: Optional[dict] = None) -> dict:
         >>> await read_query("SELECT * FROM customers WHERE id = %(id)s", {'id': 1})
         {'success': True, 'data': {'results': [{'id': 1, 'name': 'John'}], 'row_count': 1}, ...}
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(query, params or ())
-        results = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'results': results,
-            'row_count': len(results)
-        })
-        
-    except Error as e:
-        logger.error(f"Query execution failed: {e}\nQuery: {query}")
-        return format_response(False, error=str(e))
+    return await _run('read_query', query, params)
 
 async def write_query(query: str, params: Optional[dict] = None) -> dict:
     """Execute an INSERT, UPDATE, or DELETE query.
@@ -157,27 +776,7 @@ async def write_query(query: str, params: Optional[dict] = None) -> dict:
         >>> await write_query("INSERT INTO customers (name) VALUES (%(name)s)", {'name': 'Alice'})
         {'success': True, 'data': {'affected_rows': 1, 'lastrowid': 5}, ...}
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(query, params or ())
-        affected_rows = cursor.rowcount
-        conn.commit()
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'affected_rows': affected_rows,
-            'lastrowid': cursor.lastrowid
-        })
-        
-    except Error as e:
-        conn.rollback()
-        logger.error(f"Write operation failed: {e}\nQuery: {query}")
-        return format_response(False, error=str(e))
-
+    return await _run('write_query', query, params)
 
 async def create_table(table_name: str, columns: List[dict], 
                       constraints: Optional[List[str]] = None) -> dict:
@@ -207,37 +806,7 @@ async def create_table(table_name: str, columns: List[dict],
         ... ]
         >>> await create_table('customers', columns)
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor()
-        
-        column_defs = []
-        for col in columns:
-            col_def = f"`{col['name']}` {col['type']}"
-            if col.get('constraints'):
-                col_def += f" {col['constraints']}"
-            column_defs.append(col_def)
-        
-        # Fixed: Removed newlines from f-string
-        column_defs_str = ", ".join(column_defs)
-        constraints_str = ", " + ", ".join(constraints) if constraints else ""
-        create_stmt = f"CREATE TABLE `{table_name}` ({column_defs_str}{constraints_str})"
-        
-        cursor.execute(create_stmt)
-        conn.commit()
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'table_name': table_name,
-            'sql': create_stmt
-        })
-        
-    except Error as e:
-        conn.rollback()
-        logger.error(f"Table creation failed: {e}")
-        return format_response(False, error=str(e))
+    return await _run('create_table', table_name, columns, constraints)
 
 async def alter_table(table_name: str, alterations: List[dict]) -> dict:
     """Modify an existing table's structure.
@@ -256,7 +825,8 @@ async def alter_table(table_name: str, alterations: List[dict]) -> dict:
             - success: Operation status
             - data: Dictionary containing:
                 - table_name: Name of altered table
-                - alterations: List of executed ALTER statements
+                - alterations: List of executed ALTER statements (column
+                  changes are combined into a single statement)
             - error: Error message if failed
             - timestamp: Operation timestamp
 
@@ -267,38 +837,7 @@ async def alter_table(table_name: str, alterations: List[dict]) -> dict:
         ... ]
         >>> await alter_table('customers', alterations)
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor()
-        
-        alter_statements = []
-        for alter in alterations:
-            stmt = f"ALTER TABLE `{table_name}` {alter['action']}"
-            if alter['action'] in ('ADD COLUMN', 'MODIFY COLUMN'):
-                stmt += f" `{alter['name']}` {alter['type']}"
-                if alter.get('constraints'):
-                    stmt += f" {alter['constraints']}"
-            elif alter['action'] == 'DROP COLUMN':
-                stmt += f" `{alter['name']}`"
-            elif alter['action'] == 'RENAME TO':
-                stmt += f" `{alter['new_name']}`"
-            
-            alter_statements.append(stmt)
-            cursor.execute(stmt)
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'table_name': table_name,
-            'alterations': alter_statements
-        })
-        
-    except Error as e:
-        conn.rollback()
-        logger.error(f"Table alteration failed: {e}")
-        return format_response(False, error=str(e))
+    return await _run('alter_table', table_name, alterations)
 
 async def drop_table(table_name: str, if_exists: bool = True) -> dict:
     """Permanently remove a table from the database.
@@ -319,28 +858,7 @@ async def drop_table(table_name: str, if_exists: bool = True) -> dict:
     Example:
         >>> await drop_table('temp_data')
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor()
-        
-        if_exists_clause = "IF EXISTS " if if_exists else ""
-        drop_stmt = f"DROP TABLE {if_exists_clause}`{table_name}`"
-        
-        cursor.execute(drop_stmt)
-        conn.commit()
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'table_name': table_name,
-            'sql': drop_stmt
-        })
-        
-    except Error as e:
-        conn.rollback()
-        logger.error(f"Table drop failed: {e}")
-        return format_response(False, error=str(e))
+    return await _run('drop_table', table_name, if_exists)
 
 async def describe_table(table_name: str) -> dict:
     """Retrieve the structure and indexes of a table.
@@ -362,17 +880,13 @@ async def describe_table(table_name: str) -> dict:
         >>> await describe_table('customers')
     """
     try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        _ident(table_name)
         
-        cursor.execute(f"DESCRIBE `{table_name}`")
-        structure = cursor.fetchall()
-        
-        cursor.execute(f"SHOW INDEX FROM `{table_name}`")
-        indexes = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
+        # Independent lookups, so run them on two connections concurrently
+        structure, indexes = await asyncio.gather(
+            _fetch_all(f"DESCRIBE `{table_name}`"),
+            _fetch_all(f"SHOW INDEX FROM `{table_name}`")
+        )
         
         return format_response(True, {
             'table_name': table_name,
@@ -380,14 +894,16 @@ async def describe_table(table_name: str) -> dict:
             'indexes': indexes
         })
         
-    except Error as e:
-        logger.error(f"Table description failed: {e}")
+    except (Error, ValueError) as e:
+        logger.error("Table description failed: %s", e)
         return format_response(False, error=str(e))
 
 async def export_query(query: str, format: str = 'json', 
                       params: Optional[dict] = None) -> dict:
     """Execute a query and return results in specified format.
 
+    Exports are never cached, so large payloads are not held in memory.
+
     Args:
         query: SQL query to execute.
         format: Output format ('json' or 'csv').
@@ -406,40 +922,7 @@ async def export_query(query: str, format: str = 'json',
     Example:
         >>> await export_query("SELECT * FROM customers", format='csv')
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute(query, params or ())
-        results = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
-        
-        if format == 'json':
-            output = json.dumps(results, indent=2)
-        elif format == 'csv':
-            if not results:
-                output = ""
-            else:
-                headers = results[0].keys()
-                output = ",".join(headers) + "\n"
-                for row in results:
-                    output += ",".join(str(v) for v in row.values()) + "\n"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
-        
-        return format_response(True, {
-            'format': format,
-            'data': output,
-            'row_count': len(results)
-        })
-        
-    except Error as e:
-        logger.error(f"Export failed: {e}\nQuery: {query}")
-        return format_response(False, error=str(e))
-        
-
+    return await _run('export_query', query, format, params)
 
 async def append_insight(table_name: str, insight: str, 
                         metadata: Optional[dict] = None) -> dict:
@@ -463,39 +946,33 @@ async def append_insight(table_name: str, insight: str,
         >>> await append_insight('customers', 'Found 10 inactive customers', 
         ...                    {'severity': 'low'})
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS `data_insights` (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                table_name VARCHAR(255) NOT NULL,
-                insight TEXT NOT NULL,
-                metadata JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                INDEX (table_name)
-            )
-        """)
-        
-        cursor.execute("""
-            INSERT INTO `data_insights` (table_name, insight, metadata)
-            VALUES (%s, %s, %s)
-        """, (table_name, insight, json.dumps(metadata) if metadata else None))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'table_name': table_name,
-            'insight_id': cursor.lastrowid
-        })
-        
-    except Error as e:
-        conn.rollback()
-        logger.error(f"Insight append failed: {e}")
-        return format_response(False, error=str(e))
+    return await _run('append_insight', table_name, insight, metadata)
+
+async def append_insights(insights: List[dict]) -> dict:
+    """Store several analytical insights in a single round trip.
+
+    Args:
+        insights: List of insight dictionaries with keys:
+            - table_name: Table this insight relates to
+            - insight: Textual description of the insight
+            - metadata: Optional additional metadata as dictionary
+
+    Returns:
+        dict: Standardized response with:
+            - success: Operation status
+            - data: Dictionary containing:
+                - inserted: Number of insight records created
+            - error: Error message if failed
+            - timestamp: Operation timestamp
+
+    Example:
+        >>> await append_insights([
+        ...     {'table_name': 'customers', 'insight': 'Found 10 inactive customers'},
+        ...     {'table_name': 'orders', 'insight': 'Peak volume on Mondays',
+        ...      'metadata': {'severity': 'low'}}
+        ... ])
+    """
+    return await _run('append_insights', insights)
 
 async def list_insights(table_name: Optional[str] = None) -> dict:
     """Retrieve stored insights for a specific table or all tables.
@@ -516,30 +993,4 @@ async def list_insights(table_name: Optional[str] = None) -> dict:
         >>> await list_insights('customers')
         >>> await list_insights()  # Get all insights
     """
-    try:
-        conn = await get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        query = "SELECT * FROM `data_insights`"
-        params = None
-        
-        if table_name:
-            query += " WHERE table_name = %s"
-            params = (table_name,)
-        
-        query += " ORDER BY created_at DESC"
-        
-        cursor.execute(query, params or ())
-        insights = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
-        
-        return format_response(True, {
-            'insights': insights,
-            'count': len(insights)
-        })
-        
-    except Error as e:
-        logger.error(f"Insight listing failed: {e}")
-        return format_response(False, error=str(e))
\ No newline at end of file
+    return await _run('list_insights', table_name)
\ No newline at end of file